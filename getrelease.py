@@ -1,25 +1,32 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
+
 import base64
+import concurrent.futures
 import dataclasses
-import fileinput
+import datetime
+import functools
+import gzip
 import hashlib
+import http.client
 import json
 import logging
 import os
 import pathlib
+import pickle
 import platform
 import re
+import shutil
 import stat
-import tarfile
+import subprocess
+import threading
+import time
 import typing
 import urllib.error
 import urllib.parse
 import urllib.request
-import zipfile
 
-import packaging.version
-import pandas
 import rich.color
 import rich.console
 import rich.logging
@@ -29,6 +36,11 @@ import rich.table
 import typer
 import typing_extensions
 
+try:
+    import orjson # optional: parses ~3-5x and serializes ~5-10x faster than the stdlib `json`
+except ImportError:
+    orjson = None
+
 '''
 Package manager for pre-compiled/pre-built github or gitlab releases.
 Heavily inspired by [install-release](https://github.com/Rishang/install-release) and [eget](https://github.com/zyedidia/eget).
@@ -50,6 +62,15 @@ XDG_CACHE_HOME = pathlib.Path(f"{os.getenv('XDG_CACHE_HOME', pathlib.Path.home()
 XDG_CONFIG_HOME = pathlib.Path(f"{os.getenv('XDG_CONFIG_HOME', pathlib.Path.home()/'.config')}")
 XDG_DATA_HOME = pathlib.Path(f"{os.getenv('XDG_DATA_HOME', pathlib.Path.home()/'.local/share/')}")
 
+def jsonLoads(data: typing.Union[str, bytes]) -> typing.Any:
+    '''Parse JSON with `orjson`, if available.'''
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def jsonDumps(obj: typing.Any) -> str:
+    '''Serialize JSON with `orjson`, if available.'''
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+
 DEFAULT_CONFIG = dict(log_level=logging.INFO,
     github_token=os.getenv('GITHUB_TOKEN', ''),
     gitlab_token=os.getenv('GITLAB_TOKEN', ''),
@@ -74,7 +95,9 @@ class Config:
 
     def init(self, **kwargs):
         '''Instantiate from a dict.'''
-        _ = {setattr(self, k, v) for k, v in kwargs.items() if v} # [Creating class instance properties from a dictionary?](https://stackoverflow.com/a/1639197)
+        for key, value in kwargs.items():
+            if value:
+                setattr(self, key, value)
 
     def __post_init__(self):
         config = DEFAULT_CONFIG.copy()
@@ -90,17 +113,21 @@ class Config:
     def read_config_file(self, **kwargs):
         '''Read configuration options from config file and overwrite them with any options provided when instantiating the class.'''
         with self.file.open(mode='r') as config_file:
-            config = json.load(fp=config_file)
+            config = jsonLoads(config_file.read())
         config.update({k: pathlib.Path(v) for k, v in config.items() if k.endswith('_dir')}) # convert paths to `pathlib.Path` objects
         return config
 
     def write(self):
-        '''Write configuration options to config file.'''
+        '''Write configuration options to config file (atomically, and only when they changed).'''
         self.metadata_dir.mkdir(exist_ok=True)
         attrs = dataclasses.asdict(self) # note that attributes defined in `__post_init__` (i.e. `self.file`) are not included in `attrs`
         attrs.update({k: str(v) for k, v in attrs.items() if isinstance(v, pathlib.Path)}) # convert `pathlib.Path` objects to `str` in order to json serialize `attrs`
-        with self.file.open(mode='w') as config_file:
-            json.dump(obj=attrs, fp=config_file)
+        config = jsonDumps(attrs)
+        if self.file.exists() and self.file.read_text() == config:
+            return # skip the rewrite on every CLI startup when nothing changed
+        tmp_file = self.file.with_suffix('.tmp')
+        tmp_file.write_text(config)
+        os.replace(src=tmp_file, dst=self.file) # atomic on POSIX; a crash mid-write cannot leave a truncated config behind
 
 
 cfg = Config()
@@ -110,60 +137,214 @@ logging.basicConfig(level=cfg.log_level, format='%(message)s', handlers=[rich_ha
 log = logging.getLogger()
 
 
+@dataclasses.dataclass
+class HttpCache:
+    '''Cache API responses to disk and revalidate them with conditional requests.'''
+    # [Conditional requests](https://docs.github.com/en/rest/overview/resources-in-the-rest-api#conditional-requests)
+
+    cache_dir: pathlib.Path = cfg.cache_dir/'api'
+    enabled: bool = True
+
+    def filePath(self, url: str, suffix: str) -> pathlib.Path:
+        '''Return cache file path for `url`.'''
+        return self.cache_dir/f'{hashlib.sha1(url.encode()).hexdigest()}{suffix}'
+
+    def validators(self, url: str) -> typing.Dict[str, str]:
+        '''Return conditional request headers (`If-None-Match`/`If-Modified-Since`) for `url`, if a cached response exists.'''
+        if not (self.enabled and self.filePath(url=url, suffix='.json').is_file()):
+            return {}
+        headers = {}
+        etag_file = self.filePath(url=url, suffix='.etag')
+        modified_file = self.filePath(url=url, suffix='.modified')
+        if etag_file.is_file():
+            headers['If-None-Match'] = etag_file.read_text()
+        if modified_file.is_file():
+            headers['If-Modified-Since'] = modified_file.read_text() # some hosts only emit `Last-Modified`, not `ETag`
+        return headers
+
+    def response(self, url: str) -> typing.Dict[str, typing.Any]:
+        '''Return cached response for `url`.'''
+        return jsonLoads(self.filePath(url=url, suffix='.json').read_bytes())
+
+    def write(self, url: str, etag: str, response: typing.Dict[str, typing.Any], last_modified: str = None):
+        '''Write the validators and `response` for `url` to cache files.'''
+        if not (etag or last_modified):
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if etag:
+            self.filePath(url=url, suffix='.etag').write_text(etag)
+        if last_modified:
+            self.filePath(url=url, suffix='.modified').write_text(last_modified)
+        self.filePath(url=url, suffix='.json').write_text(jsonDumps(response))
+
+
+http_cache = HttpCache()
+
+
+@dataclasses.dataclass
+class ConnectionPool:
+    '''Reuse one keep-alive HTTPS connection per host (and per thread, since `http.client` connections are not thread-safe), instead of paying a TCP+TLS handshake (~150 ms) for every API call.'''
+
+    local: threading.local = dataclasses.field(default_factory=threading.local)
+
+    @property
+    def connections(self) -> typing.Dict[str, http.client.HTTPSConnection]:
+        '''Return the connection dict for the current thread.'''
+        if not hasattr(self.local, 'connections'):
+            self.local.connections = {}
+        return self.local.connections
+
+    def request(self, url: str, headers: typing.Dict[str, str], method: str = 'GET', body: str = None, redirects: int = 5) -> http.client.HTTPResponse:
+        '''Issue a request for `url` over a pooled connection, reconnecting once if the keep-alive connection went stale. Follows up to `redirects` redirects (release assets redirect to CDN hosts).'''
+        parsed = urllib.parse.urlsplit(url)
+        target = f'{parsed.path}?{parsed.query}' if parsed.query else parsed.path
+        headers = {'User-Agent': os.getenv('USERAGENT', pathlib.Path(__file__).stem), **headers} # `http.client` does not add a default `User-Agent` and the GitHub API rejects requests without one
+        connection_class = http.client.HTTPConnection if parsed.scheme == 'http' else http.client.HTTPSConnection
+        connection = self.connections.setdefault(parsed.netloc, connection_class(parsed.netloc))
+        try:
+            connection.request(method=method, url=target, body=body, headers=headers)
+            response = connection.getresponse()
+        except (http.client.HTTPException, ConnectionError, OSError):
+            connection.close()
+            self.connections[parsed.netloc] = connection = connection_class(parsed.netloc)
+            connection.request(method=method, url=target, body=body, headers=headers)
+            response = connection.getresponse()
+        if (response.status in (301, 302, 303, 307, 308)) and redirects and response.headers.get('Location'):
+            location = urllib.parse.urljoin(url, response.headers.get('Location'))
+            response.read() # drain the redirect body so the connection can be reused
+            if urllib.parse.urlsplit(location).netloc != parsed.netloc:
+                headers = {k: v for k, v in headers.items() if k.lower() != 'authorization'} # CDN hosts (e.g. S3) reject requests that carry the API auth header
+            return self.request(url=location, headers=headers, method='GET' if response.status == 303 else method, body=body, redirects=redirects - 1)
+        return response
+
+
+connection_pool = ConnectionPool()
+
+
+@dataclasses.dataclass
+class DiskCache:
+    '''Memoize parsed API responses to disk with a time-to-live.'''
+
+    cache_dir: pathlib.Path = cfg.cache_dir/'meta'
+    ttl: int = 3600 # seconds
+    enabled: bool = True
+    memo: typing.Dict[str, typing.Any] = dataclasses.field(default_factory=dict) # in-process first tier: repeated lookups within one invocation never touch disk (or unpickle) twice
+
+    def filePath(self, key: str) -> pathlib.Path:
+        '''Return cache file path for `key`.'''
+        return self.cache_dir/f'{hashlib.sha1(key.encode()).hexdigest()}.pickle'
+
+    def read(self, key: str) -> typing.Any:
+        '''Return cached value for `key` unless it is older than `self.ttl`.'''
+        if not self.enabled:
+            return
+        if key in self.memo:
+            return self.memo[key]
+        cache_file = self.filePath(key=key)
+        if cache_file.is_file() and (cache_file.stat().st_mtime > time.time() - self.ttl):
+            self.memo[key] = pickle.loads(cache_file.read_bytes())
+            return self.memo[key]
+
+    def write(self, key: str, value: typing.Any):
+        '''Write `value` for `key` to a cache file.'''
+        self.memo[key] = value
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.filePath(key=key).write_bytes(pickle.dumps(value))
+
+
+disk_cache = DiskCache()
+
+
+PROCESSOR = platform.processor() # `platform.processor()` can fork a `uname -p` subprocess on linux; call it (and `platform.machine()`) once per process
+MACHINE = platform.machine()
+
+
 @dataclasses.dataclass
 class SYS:
     '''Identify system info and define corresponding regex patterns.'''
 
     os: str = platform.system().lower() # [When to use os.name, sys.platform, or platform.system?](https://stackoverflow.com/a/11674977/13019084)
 
-    platform: str = platform.processor().lower() if platform.processor() else platform.machine().lower() if platform.machine() else ''
+    platform: str = PROCESSOR.lower() if PROCESSOR else MACHINE.lower() if MACHINE else ''
+
+    arch_pattern_dict = { # class-level (unannotated) so the dicts and the compiled union below are built once at class definition, not per instance
+        # https://github.com/workhorsy/py-cpuinfo/blob/f3f0fec58335b9699b9b294267c15f516045b1fe/cpuinfo/cpuinfo.py#L782
+        # https://github.com/zyedidia/eget/blob/master/DOCS.md#detect
+        'x86': 'x86$|x86_32|[i]?[3-6]86$|i86pc|ia[-_]?32|bepc',
+        'x86_64': 'amd64|x64|x86[-_]?64|i686[-_]?64|ia[-_]?64',
+        'arm8_32': 'armv8[-_]?[b-z]?',
+        'arm8_64': 'aarch64|arm64|armv8[-_]?a', # https://en.wikipedia.org/wiki/arm_architecture_family#64.2f32-bit_architecture
+        'arm7': 'arm$|armv[6-7]',
+        'ppc_32': 'ppc$|ppc32|prep|pmac|powermac',
+        'ppc_64': 'powerpc|ppc64',
+        'sparc_32': 'sparc$|sparc32',
+        'sparc_64': 'sparc64|sun4[u-v]',
+        's390x': 's390[x]?',
+        'mips_32': 'mips$',
+        'mips_64': 'mips64',
+        'riscv_32': 'riscv$|riscv32',
+        'riscv_64': 'riscv64',
+        'loong_32': 'loongarch32',
+        'loong_64': 'loongarch64'}
+    os_pattern_dict = {
+        # https://github.com/zyedidia/eget/blob/master/DOCS.md#detect
+        'android': 'android',
+        'darwin': 'darwin|mac[.]?os|osx',
+        'freebsd': 'freebsd',
+        'illumos': 'illumos',
+        'linux': 'linux',
+        'netbsd': 'netbsd',
+        'openbsd': 'openbsd',
+        'plan9': 'plan9',
+        'solaris': 'solaris',
+        'windows': 'win|windows',
+        'win32': 'win|windows'}
+    arch_union_regex = re.compile('|'.join(f'(?P<{arch}>{pattern})' for arch, pattern in arch_pattern_dict.items())) # one alternation with named groups; `lastgroup` identifies the arch
 
     def __post_init__(self):
-        self.arch_pattern_dict = {
-            # https://github.com/workhorsy/py-cpuinfo/blob/f3f0fec58335b9699b9b294267c15f516045b1fe/cpuinfo/cpuinfo.py#L782
-            # https://github.com/zyedidia/eget/blob/master/DOCS.md#detect
-            'x86': 'x86$|x86_32|[i]?[3-6]86$|i86pc|ia[-_]?32|bepc',
-            'x86_64': 'amd64|x64|x86[-_]?64|i686[-_]?64|ia[-_]?64',
-            'arm8_32': 'armv8[-_]?[b-z]?',
-            'arm8_64': 'aarch64|arm64|armv8[-_]?a', # https://en.wikipedia.org/wiki/arm_architecture_family#64.2f32-bit_architecture
-            'arm7': 'arm$|armv[6-7]',
-            'ppc_32': 'ppc$|ppc32|prep|pmac|powermac',
-            'ppc_64': 'powerpc|ppc64',
-            'sparc_32': 'sparc$|sparc32',
-            'sparc_64': 'sparc64|sun4[u-v]',
-            's390x': 's390[x]?',
-            'mips_32': 'mips$',
-            'mips_64': 'mips64',
-            'riscv_32': 'riscv$|riscv32',
-            'riscv_64': 'riscv64',
-            'loong_32': 'loongarch32',
-            'loong_64': 'loongarch64'}
-        self.os_pattern_dict = {
-            # https://github.com/zyedidia/eget/blob/master/DOCS.md#detect
-            'android': 'android',
-            'darwin': 'darwin|mac[.]?os|osx',
-            'freebsd': 'freebsd',
-            'illumos': 'illumos',
-            'linux': 'linux',
-            'netbsd': 'netbsd',
-            'openbsd': 'openbsd',
-            'plan9': 'plan9',
-            'solaris': 'solaris',
-            'windows': 'win|windows',
-            'win32': 'win|windows'}
-        if (platform.processor() and platform.machine()) and (platform.processor().lower() != platform.machine().lower()):
-            log.warning(f"platform.processor ('{platform.processor()}') != platform.machine '{platform.machine()}')")
+        if (PROCESSOR and MACHINE) and (PROCESSOR.lower() != MACHINE.lower()):
+            log.warning(f"platform.processor ('{PROCESSOR}') != platform.machine '{MACHINE}')")
         self.os_pattern = self.os_pattern_dict[self.os]
-        arch = [arch for arch, pattern in self.arch_pattern_dict.items() if re.match(pattern=pattern, string=self.platform)]
-        if len(arch) != 1:
-            raise ValueError(f'Processor architecture could not be recognized correctly: {arch}')
-        self.arch_pattern = self.arch_pattern_dict[arch.pop()]
+        match = self.arch_union_regex.match(self.platform)
+        if not match:
+            raise ValueError(f"Processor architecture could not be recognized correctly: '{self.platform}'")
+        self.arch_pattern = self.arch_pattern_dict[match.lastgroup]
 
     def testARCH(self) -> typing.Dict[str, typing.List[str]]:
         '''Check if entries in the `uname` wikipedia table match `self.arch_pattern`'''
         # https://en.wikipedia.org/wiki/Uname
-        uname = pandas.read_html('https://en.wikipedia.org/wiki/Uname', match='Machine')[0]['Machine (-m) POSIX'].str.lower().drop_duplicates()
-        return {a: [arch for arch, pattern in self.arch_pattern_dict.items() if re.match(pattern, a)] for a in uname}
+        import html.parser
+
+        class TableParser(html.parser.HTMLParser):
+            '''Collect table cell text grouped into rows (no pandas.read_html machinery for one column of strings).'''
+
+            def __init__(self):
+                super().__init__()
+                self.rows, self.row, self.cell, self.in_cell = [], [], '', False
+
+            def handle_starttag(self, tag, attrs):
+                if tag == 'tr':
+                    self.row = []
+                if tag in ('td', 'th'):
+                    self.in_cell, self.cell = True, ''
+
+            def handle_endtag(self, tag):
+                if tag in ('td', 'th'):
+                    self.in_cell = False
+                    self.row.append(self.cell.strip())
+                if (tag == 'tr') and self.row:
+                    self.rows.append(self.row)
+
+            def handle_data(self, data):
+                if self.in_cell:
+                    self.cell += data
+
+        parser = TableParser()
+        parser.feed(urllib.request.urlopen('https://en.wikipedia.org/wiki/Uname').read().decode())
+        header = next(row for row in parser.rows if any('Machine' in cell for cell in row))
+        column = next(index for index, cell in enumerate(header) if 'Machine' in cell)
+        uname = {row[column].lower() for row in parser.rows if (len(row) > column) and (row != header)}
+        return {a: [arch for arch, pattern in self.arch_pattern_dict.items() if re.match(pattern, a)] for a in sorted(uname)}
 
 
 @dataclasses.dataclass
@@ -183,35 +364,99 @@ class Github:
         '''Query GitHub API rate limit.''' # [Increasing the unauthenticated rate limit for OAuth Apps](https://docs.github.com/en/rest/overview/resources-in-the-rest-api#increasing-the-unauthenticated-rate-limit-for-oauth-apps)
         auth = base64.b64encode(bytes(cls.token, encoding='ascii')).decode("utf-8") # [How to use urllib with username/password authentication in python 3?](https://stackoverflow.com/a/24648149)
         request = urllib.request.Request(url='https://api.github.com/rate_limit', headers={'Authorization': f'Basic {auth}'})
-        response = json.loads(urllib.request.urlopen(request).read())
+        response = jsonLoads(urllib.request.urlopen(request).read())
         return response.get('rate')
 
+    accept = 'application/vnd.github+json' # [Media types](https://docs.github.com/en/rest/overview/media-types); overridden by `Gitlab`
+
     def query(self, url: str, per_page: int = 100, **kwargs) -> typing.Dict[str, typing.Any]:
-        '''Query GitHub/GitLab API.'''
-        headers = {'Authorization': f'Bearer {self.token}'} # https://docs.github.com/en/rest/guides/getting-started-with-the-rest-api?tool=curl#using-headers # https://docs.gitlab.com/ee/api/rest/#personalprojectgroup-access-tokens
+        '''Query GitHub/GitLab API, revalidating cached responses via `ETag`/`If-None-Match` (304 responses do not count against the rate limit).'''
+        headers = {'Authorization': f'Bearer {self.token}'} if self.token else {} # https://docs.github.com/en/rest/guides/getting-started-with-the-rest-api?tool=curl#using-headers # https://docs.gitlab.com/ee/api/rest/#personalprojectgroup-access-tokens
+        headers['Accept'] = self.accept
+        headers['Accept-Encoding'] = 'gzip' # API JSON compresses ~5x; `http.client` does not negotiate this on its own
         params = urllib.parse.urlencode({'per_page': per_page, **kwargs})
-        request = urllib.request.Request(url=f'{url}?{params}', headers=headers) if self.token else urllib.request.Request(url=f'{url}?{params}')
-        log.debug(request.full_url)
-        with urllib.request.urlopen(request) as response:
-            response = json.load(response)
+        full_url = f'{url}?{params}'
+        headers.update(http_cache.validators(url=full_url))
+        log.debug(full_url)
+        response = connection_pool.request(url=full_url, headers=headers)
+        body = response.read() # always drain the body so the keep-alive connection can be reused
+        if response.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        if response.status == 304: # [Conditional requests](https://docs.github.com/en/rest/overview/resources-in-the-rest-api#conditional-requests)
+            log.debug(f'304 {full_url}')
+            return http_cache.response(url=full_url)
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url=full_url, code=response.status, msg=response.reason, hdrs=response.headers, fp=None)
+        if response.headers.get('X-RateLimit-Remaining'):
+            log.debug(f"X-RateLimit-Remaining: {response.headers.get('X-RateLimit-Remaining')}")
+        etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        response = jsonLoads(body)
+        http_cache.write(url=full_url, etag=etag, response=response, last_modified=last_modified)
         return response
 
     def info(self) -> pandas.Series:
         '''Query repo info for `self.repo_id`.'''
+        import pandas
         repo = self.query(url=f'https://api.github.com/repos/{self.repo_id}', per_page=1)
         if repo:
             return pandas.Series(repo)
 
+    def graphql(self, query: str, variables: typing.Dict[str, str]) -> typing.Dict[str, typing.Any]:
+        '''Query the [GitHub GraphQL API](https://docs.github.com/en/graphql) (requires a token).'''
+        headers = {'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'}
+        response = connection_pool.request(url='https://api.github.com/graphql', headers=headers, method='POST', body=jsonDumps(dict(query=query, variables=variables)))
+        body = response.read()
+        if response.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url='https://api.github.com/graphql', code=response.status, msg=response.reason, hdrs=response.headers, fp=None)
+        return jsonLoads(body)
+
     def releaseTag(self, tag: str = 'latest') -> pandas.Series:
         '''Query release tag info for `self.repo_id`.'''
         if tag in ('pre', 'pre-release', 'prerelease'):
             return self.preReleaseTag()
+        if self.token:
+            return self.releaseTagGraphql(tag=tag) # GraphQL requires auth; fall back to REST when no token is set
+        return self.releaseTagRest(tag=tag)
+
+    def releaseTagRest(self, tag: str = 'latest') -> pandas.Series:
+        '''Query release tag info for `self.repo_id` via the REST endpoint.'''
+        import pandas
         tag = f'tags/{tag}' if tag != 'latest' else tag # [Get a release by tag name](https://docs.github.com/en/rest/releases/releases#get-a-release-by-tag-name)
         response = self.query(url=f'https://api.github.com/repos/{self.repo_id}/releases/{tag}', per_page=1)
         return pandas.Series(response)
 
+    def releaseTagGraphql(self, tag: str = 'latest') -> pandas.Series:
+        '''Query release tag info for `self.repo_id` via GraphQL, requesting only the fields that are actually used (the full REST payload is ~5-10x larger). The repo info rides along in the same round-trip and primes the info cache.'''
+        import pandas
+        owner, name = self.repo_id.split('/')
+        repo_fields = 'nameWithOwner description url updatedAt stargazerCount primaryLanguage {name} repositoryTopics(first: 20) {nodes {topic {name}}}'
+        release_fields = '{tagName publishedAt releaseAssets(first: 100) {nodes {name downloadUrl}}}'
+        release_key = 'latestRelease' if tag == 'latest' else 'release'
+        release_query = f'latestRelease {release_fields}' if tag == 'latest' else f'release(tagName: $tag) {release_fields}'
+        tag_declaration = '' if tag == 'latest' else ', $tag: String!'
+        query = f'query($owner: String!, $name: String!{tag_declaration}) {{repository(owner: $owner, name: $name) {{{repo_fields} {release_query}}}}}'
+        variables = dict(owner=owner, name=name) if tag == 'latest' else dict(owner=owner, name=name, tag=str(tag)) # `install --url` passes a parsed `packaging` Version here, which is not JSON serializable
+        response = self.graphql(query=query, variables=variables)
+        if response.get('errors'):
+            log.warning(f"graphql: {response['errors']}")
+            return self.releaseTagRest(tag=str(tag)) # rate limits, SAML enforcement and transient 5xx surface as soft `errors`; the REST endpoint may still answer
+        repository = response.get('data', {}).get('repository') or {}
+        if repository.get('nameWithOwner'):
+            repo_info = pandas.Series(dict(full_name=repository['nameWithOwner'], description=repository.get('description'), html_url=repository.get('url'), updated_at=repository.get('updatedAt'),
+                stargazers_count=repository.get('stargazerCount'), language=(repository.get('primaryLanguage') or {}).get('name'),
+                topics=[node['topic']['name'] for node in repository.get('repositoryTopics', {}).get('nodes', [])]))
+            disk_cache.write(key=f'{self.repo_id}/info', value=repo_info) # saves Repo.info a second API round-trip within the TTL
+        release = repository.get(release_key)
+        if not release:
+            return pandas.Series()
+        assets = [dict(name=asset['name'], browser_download_url=asset['downloadUrl']) for asset in release['releaseAssets']['nodes']]
+        return pandas.Series(dict(tag_name=release['tagName'], published_at=release['publishedAt'], assets=assets))
+
     def preReleaseTag(self) -> pandas.Series:
         '''Query release tag info for `self.repo_id`.'''
+        import pandas
         response = self.query(url=f'https://api.github.com/repos/{self.repo_id}/releases', per_page=100)
         releases = pandas.DataFrame(response)
         return releases[releases.prerelease == True].head(1).squeeze()
@@ -224,6 +469,8 @@ class Gitlab(Github):
     repo_id: str
     token: str = cfg.gitlab_token
 
+    accept = 'application/json'
+
     def __post_init__(self):
         self.repo_id = self.repo_id.replace('/', '%2F') # [Get the `id` of gitlab project via gitlab api or gitlab-cli](https://stackoverflow.com/a/54824458)
         if not self.token:
@@ -231,6 +478,7 @@ class Gitlab(Github):
 
     def info(self) -> pandas.Series:
         '''Query repo info for `self.repo_id`.''' # [Get single project](https://docs.gitlab.com/ee/api/projects.html#get-single-project)
+        import pandas
         repo = self.query(url=f'https://gitlab.com/api/v4/projects/{self.repo_id}', license=True, per_page=1)
         if repo:
             repo = pandas.Series(repo)
@@ -239,6 +487,7 @@ class Gitlab(Github):
 
     def releaseTag(self, tag: str = 'latest') -> pandas.Series:
         '''Return release tag info for `self.repo_id`.'''
+        import pandas
         tag = f'permalink/{tag}' if tag == 'latest' else tag
         response = self.query(url=f'https://gitlab.com/api/v4/projects/{self.repo_id}/releases/{tag}', per_page=1)
         return pandas.Series(response)
@@ -253,36 +502,41 @@ class Repo:
     gitlab: bool = False
 
     def __post_init__(self):
-        self.github = True if 'github.com' in self.id else False
-        self.gitlab = True if 'gitlab.com' in self.id else False
-        self.id = self.parseID()
+        self.gitlab = 'gitlab.com' in self.id # match the host, not the whole id: repo names may themselves contain 'gitlab' (e.g. 'firecow/gitlab-ci-local')
+        self.github = not self.gitlab # ambiguous bare 'owner/repo' ids assume github (by far the common case) rather than speculatively querying github and falling back to gitlab on a 404
+        self.host_assumed = not (self.gitlab or ('github.com' in self.id)) # remember the guess so 404s can hint at passing a full url
+        self.id = self.parseID(repo_id=self.id)
 
-    def parseID(self) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024) # 'ls'/'upgrade-all' re-parse the same ids once per row
+    def parseID(repo_id: str) -> str:
         '''Parse org and repo from `repo_id`'''
-        match = re.match(pattern='(?:https?://)?(?:git[hl][au]b.com)?/?([a-zA-Z0-9_-]+/[\.a-zA-Z0-9_-]+)', string=self.id) # [Rules for special characters in github repository name?](https://stackoverflow.com/a/59082561/13019084)
+        match = re.match(pattern='(?:https?://)?(?:git[hl][au]b.com)?/?([a-zA-Z0-9_-]+/[\.a-zA-Z0-9_-]+)', string=repo_id) # [Rules for special characters in github repository name?](https://stackoverflow.com/a/59082561/13019084)
         if not match:
             raise ValueError("please provide github.com/gitlab.com repo url or organization & repo separated by a slash, e.g. 'https://github.com/junegunn/fzf' or 'junegunn/fzf'")
         return match.group(1)
 
     def info(self) -> pandas.Series:
         '''Return repo info for github or gitlab repo.'''
-        func = Github(repo_id=self.id).info if self.github else Gitlab(repo_id=self.id).info if self.gitlab else None
-        if func:
-            return func()
-        try:
-            return Github(repo_id=self.id).info()
-        except urllib.error.HTTPError:
-            return Gitlab(repo_id=self.id).info()
+        cached = disk_cache.read(key=f'{self.id}/info')
+        if cached is not None:
+            return cached
+        func = Gitlab(repo_id=self.id).info if self.gitlab else Github(repo_id=self.id).info
+        repo_info = func()
+        if (repo_info is not None) and (not repo_info.empty): # never cache empty payloads; a transient failure must not stick for the whole TTL
+            disk_cache.write(key=f'{self.id}/info', value=repo_info)
+        return repo_info
 
     def releaseTag(self, tag: str = 'latest') -> pandas.Series:
         '''Return release tag info for github or gitlab repo.'''
-        func = Github(repo_id=self.id).releaseTag if self.github else Gitlab(repo_id=self.id).releaseTag if self.gitlab else None
-        if func:
-            return func(tag=tag)
-        try:
-            return Github(repo_id=self.id).releaseTag(tag=tag)
-        except urllib.error.HTTPError:
-            return Gitlab(repo_id=self.id).releaseTag(tag=tag)
+        cached = disk_cache.read(key=f'{self.id}/releaseTag/{tag}')
+        if cached is not None:
+            return cached
+        func = Gitlab(repo_id=self.id).releaseTag if self.gitlab else Github(repo_id=self.id).releaseTag
+        tag_info = func(tag=tag)
+        if (tag_info is not None) and (not tag_info.empty): # never cache empty payloads; a transient failure must not stick for the whole TTL
+            disk_cache.write(key=f'{self.id}/releaseTag/{tag}', value=tag_info)
+        return tag_info
 
 
 @dataclasses.dataclass
@@ -300,14 +554,14 @@ class Asset:
     col_time_remaining: rich.progress.TimeRemainingColumn = rich.progress.TimeRemainingColumn()
 
     @classmethod
-    def identify(cls, asset_urls: pandas.Series, asset_pattern: re.Pattern = '.*') -> str:
+    def identify(cls, asset_urls: typing.Sequence[str], asset_pattern: re.Pattern = '.*') -> str:
         '''Return download url for assets corresponding to `OS_PATTERN` and `ARCH_PATTERN`. Note that `asset_pattern` has twice the weight as the other criteria.'''
-        os = asset_urls.str.contains(OS_PATTERN, regex=True, case=False).astype(int)
-        arch = asset_urls.str.contains(ARCH_PATTERN, regex=True, case=False).astype(int)
-        filetype_veto = asset_urls.str.endswith(('.deb', '.rpm', '.sha1', '.sha256', '.sha256sum', '.sum')).astype(int)
-        asset_pattern = asset_urls.str.contains(asset_pattern, regex=True, case=False).astype(int)
-        match = os + arch - filetype_veto + 2*asset_pattern
-        assets = asset_urls[match == match.max()].to_list()
+        urls = list(asset_urls)
+        filetype_veto = ('.deb', '.rpm', '.sha1', '.sha256', '.sha256sum', '.sum')
+        pattern = compileRegex(asset_pattern, flags=re.IGNORECASE) if asset_pattern != '.*' else None # fast path: the default pattern matches everything
+        match = [bool(OS_REGEX.search(url)) + bool(ARCH_REGEX.search(url)) - url.endswith(filetype_veto) + 2*bool(pattern.search(url) if pattern else True) for url in urls]
+        best_score = max(match)
+        assets = [url for url, score in zip(urls, match) if score == best_score]
         log.debug(f'{assets = }')
         if len(assets) == 1:
             log.info(assets)
@@ -317,27 +571,63 @@ class Asset:
             asset_pattern = rich.prompt.Prompt.ask('(regex) asset_pattern')
             return cls.identify(asset_urls=asset_urls, asset_pattern=asset_pattern)
 
-    def download(self, url: str, force: bool = False):
-        '''Download `url` to `self.file_path` with a `rich` progress bar.'''
+    def download(self, url: str, force: bool = False) -> str:
+        '''Download `url` to `self.file_path` with a `rich` progress bar, resuming a partial `.part` download when the server honors range requests. Returns the sha256 of the downloaded bytes (None when the download was skipped).'''
         # https://github.com/Textualize/rich/blob/master/examples/downloader.py
         progress_columns = [v for k,v in dataclasses.asdict(self).items() if k.startswith('col_')] # [rich.progress.Progress](https://rich.readthedocs.io/en/stable/reference/progress.html#rich.progress.Progress)
         progress = rich.progress.Progress(*progress_columns)
         task_id = progress.add_task(description="download", start=False, url=url, filename=self.file_path)
         log.debug(f'{url = }')
-        response = urllib.request.urlopen(urllib.request.Request(url, headers={'User-Agent': os.environ['USERAGENT']}))
-        if self.file_path.exists():
-            local_file_size, remote_file_size = self.file_path.stat().st_size, int(response.length)
-            log.debug(f"'{self.file_path}': {local_file_size} bytes\n'{url}': {remote_file_size} bytes")
-        if self.file_path.exists() and (local_file_size == remote_file_size) and (not force):
-            return log.warning(f'{self.file_path} already exists')
-        progress.update(task_id=task_id, total=float(response.length))
+        request_headers = {} # the connection pool injects the default `User-Agent`
+        part_path = self.file_path.with_name(f'{self.file_path.name}.part')
+        try:
+            offset = part_path.stat().st_size if not force else 0
+        except FileNotFoundError:
+            offset = 0
+        if offset:
+            request_headers['Range'] = f'bytes={offset}-' # [Range requests](https://developer.mozilla.org/en-US/docs/Web/HTTP/Range_requests)
+        response = connection_pool.request(url=url, headers=request_headers) # downloads reuse the same keep-alive pool (and its redirect handling) as the API queries
+        if offset and (response.status >= 400): # stale partial (e.g. 416 Range Not Satisfiable after the remote asset changed); discard it and restart from scratch
+            log.warning(f"discarding stale partial download '{part_path}' ({response.status} {response.reason})")
+            response.read()
+            part_path.unlink(missing_ok=True)
+            offset = 0
+            del request_headers['Range']
+            response = connection_pool.request(url=url, headers=request_headers)
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url=url, code=response.status, msg=response.reason, hdrs=response.headers, fp=None)
+        if offset and (response.status != 206):
+            offset = 0 # server ignored the range request; restart from scratch
+        total_size = offset + int(response.length)
+        try:
+            local_file_size = self.file_path.stat().st_size
+        except FileNotFoundError:
+            local_file_size = None
+        if local_file_size is not None:
+            log.debug(f"'{self.file_path}': {local_file_size} bytes\n'{url}': {total_size} bytes")
+            if (local_file_size == total_size) and (not force):
+                return log.warning(f'{self.file_path} already exists')
+        sha256 = hashlib.sha256()
+        if offset:
+            with part_path.open(mode='rb') as part_file:
+                sha256 = hashlib.file_digest(part_file, 'sha256') # fold the already-downloaded bytes into the running checksum
+        progress.update(task_id=task_id, total=float(total_size))
         with progress:
-            with self.file_path.open(mode='wb') as out_file:
+            with part_path.open(mode='ab' if offset else 'wb', buffering=2**20) as out_file:
                 progress.start_task(task_id=task_id)
-                for chunk in iter(lambda: response.read(2**10), b''):
+                progress.update(task_id=task_id, advance=offset)
+                advance, last_update = 0, 0.0
+                for chunk in iter(lambda: response.read(2**20), b''): # 1 MiB chunks
                     out_file.write(chunk)
-                    progress.update(task_id=task_id, advance=len(chunk))
+                    sha256.update(chunk) # hash chunks as they arrive so `Checksum.verify` does not need to re-read the file from disk
+                    advance += len(chunk)
+                    if time.monotonic() - last_update > 0.05: # batch progress updates to ~20 Hz; on fast links the rendering would otherwise outweigh the reads
+                        progress.update(task_id=task_id, advance=advance)
+                        advance, last_update = 0, time.monotonic()
+                progress.update(task_id=task_id, advance=advance)
+        os.replace(src=part_path, dst=self.file_path) # the completed download atomically replaces any previous copy; an interrupted one leaves `.part` behind for the next resume
         log.info(f'downloaded {self.file_path}')
+        return sha256.hexdigest()
 
     @staticmethod
     def chmodExecutable(file_path: pathlib.Path):
@@ -347,6 +637,8 @@ class Asset:
 
     def extract(self, destination: pathlib.Path = cfg.data_dir) -> pathlib.Path:
         '''Extract `self.file_path` to `destination`.'''
+        import tarfile
+        import zipfile
         if tarfile.is_tarfile(self.file_path):
             return self.extractTAR(destination=destination)
         if zipfile.is_zipfile(self.file_path):
@@ -355,17 +647,56 @@ class Asset:
         self.chmodExecutable(file_path=self.file_path)
         return self.file_path.rename(destination/self.file_path.stem)
 
+    def extractSubprocess(self, command: typing.List[str], destination: pathlib.Path) -> pathlib.Path:
+        '''Extract with a system extractor into a staging directory, then move the payload into `destination` (mirroring the layout the in-process extractors produce).'''
+        staging_dir = destination/f'.{self.file_path.name}.staging'
+        rmRecursive(path=staging_dir)
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        subprocess.run([arg.format(staging_dir=staging_dir) for arg in command], check=True, capture_output=True)
+        entries = list(staging_dir.iterdir())
+        if len(entries) == 1:
+            extracted_dir = destination/entries[0].name
+            rmRecursive(path=extracted_dir)
+            os.replace(src=entries[0], dst=extracted_dir)
+            staging_dir.rmdir()
+        else:
+            extracted_dir = destination/self.file_path.stem.rstrip('.tar') # no common top-most directory inside the archive
+            rmRecursive(path=extracted_dir)
+            os.replace(src=staging_dir, dst=extracted_dir)
+        return extracted_dir
+
+    @staticmethod
+    def decompressProgram(file_path: pathlib.Path) -> typing.List[str]:
+        '''Return `tar --use-compress-program` arguments for a parallel decompressor, when one is installed.'''
+        programs = {('.tar.gz', '.tgz'): ('pigz', '-dc'), ('.tar.xz', '.txz'): ('xz', '-T0', '-dc'), ('.tar.zst', '.tzst'): ('zstd', '-T0', '-dc')}
+        for suffixes, program in programs.items():
+            if file_path.name.endswith(suffixes) and shutil.which(program[0]):
+                return ['--use-compress-program', str.join(' ', program)]
+        return [] # tar auto-detects the compression and uses its single-threaded default
+
     def extractTAR(self, destination: pathlib.Path = cfg.data_dir) -> pathlib.Path:
+        import tarfile
         with RICH_CONSOLE.status(f"extracting [green]'{self.file_path}'[/]", spinner='point') as status:
-            with tarfile.open(name=self.file_path, mode='r:*') as tar:
-                base_dir = os.path.commonpath(tar.getnames()) # [With Python's 'tarfile', how can I get the top-most directory in a tar archive?](https://stackoverflow.com/a/11269228)
-                extracted_dir = destination/base_dir
-                if not base_dir:
+            if shutil.which('tar'): # system tar is a C implementation with bigger buffers; markedly faster than `tarfile` on large archives
+                extracted_dir = self.extractSubprocess(command=['tar'] + self.decompressProgram(self.file_path) + ['-xf', str(self.file_path), '-C', '{staging_dir}'], destination=destination)
+                log.info(f'extracted {self.file_path}\nto {extracted_dir}')
+                return extracted_dir
+            with tarfile.open(name=self.file_path, mode='r|*') as tar: # streaming: one pass over the archive, no index materialization or seeks
+                members = iter(tar)
+                first = next(members, None)
+                if first is None:
+                    return destination
+                if first.isdir() or ('/' in first.name):
+                    base_dir = first.name.split('/', 1)[0]
+                    extracted_dir = destination/base_dir
+                else:
                     # extract into `base_dir` if there is no common top-most directory inside the archive
                     base_dir = self.file_path.stem.rstrip('.tar')
                     destination = destination/base_dir
                     extracted_dir = destination
-                tar.extractall(path=destination)
+                tar.extract(first, path=destination)
+                for member in members:
+                    tar.extract(member, path=destination)
         log.info(f'extracted {self.file_path}\nto {extracted_dir}')
         return extracted_dir
 
@@ -384,7 +715,12 @@ class Asset:
             pathlib.Path(extracted_path).chmod(mode=unix_attributes)
 
     def extractZIP(self, destination: pathlib.Path = cfg.data_dir) -> pathlib.Path:
+        import zipfile
         with RICH_CONSOLE.status(f"extracting [green]'{self.file_path}'[/]", spinner='point') as status:
+            if shutil.which('unzip'): # system unzip also preserves unix permissions natively, making the `zipfile` workaround below unnecessary
+                extracted_dir = self.extractSubprocess(command=['unzip', '-q', '-o', str(self.file_path), '-d', '{staging_dir}'], destination=destination)
+                log.info(f'extracted {self.file_path}\nto {extracted_dir}')
+                return extracted_dir
             with zipfile.ZipFile(self.file_path, mode='r') as zip:
                 base_dir = os.path.commonpath(zip.namelist()) # [With Python's 'tarfile', how can I get the top-most directory in a tar archive?](https://stackoverflow.com/a/11269228)
                 extracted_dir = destination/base_dir
@@ -402,40 +738,57 @@ class Asset:
 class Checksum:
     '''Identify and verify checksum for asset.'''
 
-    asset_urls: pandas.Series
+    asset_urls: typing.List[str]
     asset_filename: str
 
+    checksums_file_regex = re.compile('checksums.txt$|sha256.txt$|sha256sum.txt$', flags=re.IGNORECASE) # compiled once at class scope; unannotated, so not a dataclass field
+    checksum_file_regex = re.compile('sha256$|sha256sum$|sum$', flags=re.IGNORECASE)
+
+    def __post_init__(self):
+        self.asset_urls = list(self.asset_urls) # accept any iterable of urls (e.g. the pandas.Series returned by assetURL)
+
+    @staticmethod
+    def fetchChecksums(url: str) -> typing.List[typing.List[str]]:
+        '''Fetch a checksum file over the shared keep-alive pool and split each line into `[checksum, filename]` fields (whitespace-separated; the filename may be absent).'''
+        response = connection_pool.request(url=url, headers={}) # checksum files live next to the asset just downloaded, so the connection is already warm
+        body = response.read()
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url=url, code=response.status, msg=response.reason, hdrs=response.headers, fp=None)
+        return [line.split(None, 1) for line in body.decode().splitlines() if line.strip()]
+
     def fromFile(self) -> str:
         '''Parse file containing checksums and return checksum corresponding to `asset_url`.''' # 'cli/cli'
-        checksums_file = self.asset_urls[self.asset_urls.str.contains('checksums.txt$|sha256.txt$|sha256sum.txt$', regex=True, flags=re.IGNORECASE)]
-        if checksums_file.empty:
+        checksums_file = [url for url in self.asset_urls if self.checksums_file_regex.search(url)]
+        if not checksums_file:
             return
-        checksums_file = checksums_file.item()
-        checksums = pandas.read_csv(checksums_file, sep='\s+', names=['checksum', 'filename'])
-        return checksums[checksums.filename.str.endswith(self.asset_filename)]['checksum'].item()
+        checksums = self.fetchChecksums(url=checksums_file[0])
+        return next((checksum for checksum, *filename in checksums if filename and filename[0].strip().lstrip('*').endswith(self.asset_filename)), None) # a leading '*' marks binary mode in shasum output
 
     def fromFiles(self) -> str:
         '''Identify checksum file corresponding to `asset_url` and return its checksum.''' # 'neovim/neovim'
-        checksum_files = self.asset_urls[self.asset_urls.str.contains('sha256$|sha256sum$|sum$', regex=True, flags=re.IGNORECASE)]
-        if checksum_files.empty:
+        checksum_files = [url for url in self.asset_urls if self.checksum_file_regex.search(url)]
+        checksum_file_urls = [url for url in checksum_files if self.asset_filename in url]
+        if not checksum_file_urls:
             return
-        checksum_file_url = checksum_files[checksum_files.str.contains(self.asset_filename)].item()
-        return pandas.read_csv(checksum_file_url, sep='\s+', names=['checksum', 'filename'])['checksum'].item()
+        checksums = self.fetchChecksums(url=checksum_file_urls[0])
+        return checksums[0][0] if checksums else None
 
-    def verify(self, file_path: pathlib.Path) -> bool:
-        '''Calculate asset checksum and verify against checksum file(s), if available.'''
-        if self.asset_urls.empty:
+    def verify(self, file_path: pathlib.Path, download_checksum: str = None) -> bool:
+        '''Verify asset checksum against checksum file(s), if available. Calculates the checksum unless one was already computed while downloading.'''
+        if not self.asset_urls:
             return
         checksum_from_file = self.fromFile()
         checksum_from_files = self.fromFiles()
         reference_checksum = checksum_from_file if checksum_from_file else checksum_from_files if checksum_from_files else None
         if reference_checksum:
-            with file_path.open(mode='rb') as target_file:
-                download_checksum = hashlib.sha256(target_file.read()).hexdigest()
+            if not download_checksum:
+                with file_path.open(mode='rb') as target_file:
+                    download_checksum = hashlib.file_digest(target_file, 'sha256').hexdigest() # [hashlib.file_digest](https://docs.python.org/3/library/hashlib.html#hashlib.file_digest)
             log.debug(f'{reference_checksum = }\n{download_checksum  = }')
             if reference_checksum != download_checksum:
                 raise ValueError("checksums don't match!")
             log.info(f"checksums match! ('{download_checksum}')")
+            return True
 
 
 @dataclasses.dataclass
@@ -450,13 +803,29 @@ class Executables:
         '''Check if `file_path` is a file and has executable permissions.'''
         return file_path.is_file() and os.access(file_path, mode=os.X_OK)
 
+    @classmethod
+    def scan(cls, directory: pathlib.Path, bin_regex: re.Pattern) -> typing.List[pathlib.Path]:
+        '''Recursively collect executable files matching `bin_regex`.'''
+        executables = []
+        for entry in os.scandir(directory):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in ('.git', 'doc', 'docs', 'man', 'share'):
+                    continue # docs/VCS subtrees can hold thousands of files and never contain the payload binaries
+                executables += cls.scan(directory=entry.path, bin_regex=bin_regex)
+            elif entry.is_file() and (entry.stat().st_mode & 0o111) and bin_regex.search(entry.path): # `DirEntry.stat` results are cached
+                executables.append(pathlib.Path(entry.path))
+        return executables
+
     @classmethod
     def identify(cls, extracted_path: pathlib.Path, bin_pattern: re.Pattern = '.*') -> typing.List[pathlib.Path]:
         '''Identify executable or binary files in `extracted_path`.'''
         if cls.isExecutableFile(extracted_path):
             log.debug(f'executable: {extracted_path}')
             return [extracted_path]
-        executables = [f for f in extracted_path.rglob('*') if cls.isExecutableFile(f) and re.search(pattern=bin_pattern, string=str(f))]
+        bin_regex = compileRegex(bin_pattern)
+        top_bin_dir = extracted_path/'bin'
+        executables = cls.scan(directory=top_bin_dir, bin_regex=bin_regex) if top_bin_dir.is_dir() else [] # short-circuit: a top-level `bin/` almost always holds the payload
+        executables = executables if executables else cls.scan(directory=extracted_path, bin_regex=bin_regex)
         if len(executables) == 1:
             log.debug(f'executable: {executables[0]}')
             return executables
@@ -480,7 +849,7 @@ class Executables:
         '''Create symlink for executable files, renaming accordingly in case of a single executable file.'''
         if len(self.extracted_bin) == 1:
             extracted_bin = self.extracted_bin[0]
-            contains_system_info = re.findall(pattern=f'{OS_PATTERN}|{ARCH_PATTERN}', string=extracted_bin.name.lower())
+            contains_system_info = SYSTEM_REGEX.search(extracted_bin.name.lower())
             bin_name = symlink_alias if symlink_alias else self.repo_id.split('/')[-1] if contains_system_info else extracted_bin.name
             self.link(target=extracted_bin, symlink=bin_dir/bin_name)
             symlinks = [bin_dir/bin_name]
@@ -497,34 +866,96 @@ class Meta:
 
     metadata_dir: pathlib.Path = cfg.metadata_dir
 
-    def __post_init__(self):
-        self.repo = dict(full_name='name', path_with_namespace='name', description='description', topics='topics', language='language', stargazers_count='stars', star_count='stars', html_url='url', web_url='url', updated_at='updated')
-        self.tag = dict(tag_name='tag', published_at='published', released_at='published')
-        self.meta = dict(installed='installed', symlinks='symlinks')
+    index: typing.ClassVar[typing.Dict[str, typing.Dict[str, typing.Any]]] = None # process-lifetime cache of parsed metadata files, keyed by file stem
+
+    # key -> label projections, shared by every instance
+    repo = dict(full_name='name', path_with_namespace='name', description='description', topics='topics', language='language', stargazers_count='stars', star_count='stars', html_url='url', web_url='url', updated_at='updated')
+    tag = dict(tag_name='tag', published_at='published', released_at='published')
+    meta = dict(installed='installed', symlinks='symlinks')
+
+    write_lock = threading.Lock() # concurrent installs must not interleave metadata writes
+
+    @staticmethod
+    def readFile(file_path: pathlib.Path) -> typing.Dict[str, typing.Any]:
+        '''Parse a metadata file, tolerating corruption — one truncated file must not abort `ls`/`upgrade-all`.'''
+        try:
+            return jsonLoads(file_path.read_bytes())
+        except ValueError:
+            log.warning(f"skipping corrupt metadata file '{file_path}'")
+
+    def load(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        '''Load the metadata directory into the index (once per process) and return it.'''
+        if Meta.index is None:
+            file_paths = list(self.metadata_dir.glob('*json'))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+                parsed = list(pool.map(self.readFile, file_paths))
+            Meta.index = {file_path.stem: metadata for file_path, metadata in zip(file_paths, parsed) if metadata is not None}
+        return Meta.index
+
+    @property
+    def index_file(self) -> pathlib.Path:
+        '''Compact ndjson index of installed utilities (one line per `meta` section); the per-repo json files remain authoritative.'''
+        return self.metadata_dir/'installed.jsonl'
+
+    def installed(self) -> typing.List[typing.Dict[str, typing.Any]]:
+        '''Return the `meta` section for every installed utility from the ndjson index (one open+read instead of N), rebuilding it from the per-repo files when missing.'''
+        if self.index_file.is_file():
+            try:
+                return [jsonLoads(line) for line in self.index_file.read_bytes().splitlines()]
+            except ValueError:
+                log.warning(f"rebuilding corrupt index '{self.index_file}'")
+        installed = [metadata.get('meta', {}) for metadata in self.load().values()]
+        self.writeIndex(installed=installed)
+        return installed
+
+    def writeIndex(self, installed: typing.List[typing.Dict[str, typing.Any]]):
+        '''Write the ndjson index atomically.'''
+        self.metadata_dir.mkdir(exist_ok=True)
+        tmp_file = self.index_file.with_suffix('.tmp')
+        tmp_file.write_text(str.join('', [f'{jsonDumps(meta)}\n' for meta in installed]))
+        os.replace(src=tmp_file, dst=self.index_file)
+
+    def updateIndex(self, repo_id: str, meta: typing.Dict[str, typing.Any] = None):
+        '''Replace (or, when `meta` is None, drop) the `repo_id` entry in the ndjson index.'''
+        if not self.index_file.is_file():
+            return # rebuilt lazily on the next installed() call
+        installed = [entry for entry in self.installed() if entry.get('repo_id') != repo_id]
+        if meta:
+            installed.append(meta)
+        self.writeIndex(installed=installed)
 
     def write(self, metadata: typing.Dict[str, typing.Any]):
         '''Write (and overwrite) release metadata.'''
-        self.metadata_dir.mkdir(exist_ok=True)
-        file_path = self.metadata_dir/f"{metadata['meta']['repo_id'].replace('/', '_')}.json"
-        file_path.unlink(missing_ok=True)
-        with file_path.open(mode='w') as out_file:
-            json.dump(obj=metadata, fp=out_file)
-        log.debug(f'release metadata written to {file_path}')
+        with self.write_lock:
+            self.metadata_dir.mkdir(exist_ok=True)
+            key = metadata['meta']['repo_id'].replace('/', '_')
+            file_path = self.metadata_dir/f'{key}.json'
+            tmp_file = file_path.with_suffix('.tmp')
+            tmp_file.write_text(jsonDumps(metadata))
+            os.replace(src=tmp_file, dst=file_path) # atomic; deliberately no fsync — metadata is regenerable and os.replace keeps the previous version on a crash
+            if Meta.index is not None:
+                Meta.index[key] = metadata
+            self.updateIndex(repo_id=metadata['meta']['repo_id'], meta=metadata['meta'])
+            log.debug(f'release metadata written to {file_path}')
 
     def read(self, repo_id: str) -> typing.Dict[str, typing.Any]:
         '''Read release metadata.'''
-        file_path = self.metadata_dir/f"{repo_id.replace('/', '_')}.json"
-        if not file_path.is_file():
-            return {}
-        with file_path.open(mode='r') as in_file:
-            return json.load(fp=in_file)
-
-    def readKeys(self, file_path: pathlib.Path) -> pandas.Series:
-        '''Read metadata `keys` from `file_path` as `pandas.Series`.'''
+        return self.load().get(repo_id.replace('/', '_'), {})
+
+    def delete(self, repo_id: str):
+        '''Delete release metadata.'''
+        with self.write_lock:
+            key = repo_id.replace('/', '_')
+            (self.metadata_dir/f'{key}.json').unlink(missing_ok=True)
+            if Meta.index is not None:
+                Meta.index.pop(key, None)
+            self.updateIndex(repo_id=repo_id)
+
+    def readKeys(self, file_path: pathlib.Path) -> typing.Dict[str, typing.Any]:
+        '''Read metadata `keys` from `file_path` as a flat dict.'''
         keys = {'repo': self.repo, 'tag': self.tag, 'meta': self.meta}
-        with file_path.open(mode='r') as f:
-            metadata = json.load(f)
-        return pandas.concat([pandas.Series({label: metadata[categ][key] for key, label in map.items() if metadata[categ].get(key)}) for categ, map in keys.items()], axis=0)
+        metadata = self.readFile(file_path=file_path) or {}
+        return {label: metadata[categ][key] for categ, map in keys.items() for key, label in map.items() if metadata.get(categ, {}).get(key)}
 
 
 # [Python: How to remove default options on Typer CLI?](https://stackoverflow.com/a/63316503)
@@ -546,6 +977,7 @@ class Help:
     url = 'install directly from url'
     tag = 'release tag'
     confirm = 'proceed without prompting for confirmation'
+    no_cache = 'bypass cached API responses and query the API unconditionally'
     force_download = 'download asset even if it already exists.'
     download_only = 'download asset only and do not install it; note that asset will be downloaded, even if it already exists.'
     quiet = 'set logging level to error'
@@ -576,6 +1008,7 @@ class Typer:
     symlink_alias = typing_extensions.Annotated[str, typer.Option(help=Help.symlink_alias)]
 
     confirm: bool = typing_extensions.Annotated[bool, typer.Option('--confirm', '-y', help=Help.confirm)]
+    no_cache: bool = typing_extensions.Annotated[bool, typer.Option('--no-cache', help=Help.no_cache)]
 
     force_download: bool = typing_extensions.Annotated[bool, typer.Option('--force-download', '-f', help=Help.force_download)]
     download_only: bool = typing_extensions.Annotated[bool, typer.Option('--download-only', '-d', help=Help.download_only)]
@@ -606,15 +1039,18 @@ def config(log_level: Typer.log_level = DEFAULT_CONFIG['log_level'],
 
 
 @app.command()
-def info(repo_id: Typer.repo_id) -> pandas.Series:
+def info(repo_id: Typer.repo_id, no_cache: Typer.no_cache = False):
     '''Query repository info.'''
+    import pandas
+    if no_cache:
+        http_cache.enabled = disk_cache.enabled = False
     keys =  {**Meta().repo, **dict(created_at='created', open_issues_count='issues', has_downloads='downloads', visibility='visibility', archived='archived')}
     try:
         repo_info = Repo(id=repo_id).info()
     except urllib.error.HTTPError as e:
         log.error(f'{e.code} {e.reason} {e.url}')
         return pandas.Series()
-    title = repo_info.get('full_name', repo_info.get('path_with_namespace'))
+    title = pick(repo_info, keys=('full_name', 'path_with_namespace'))
     table = rich.table.Table(title=title, border_style='blue', show_header=False)
     [table.add_row(key, str(val)) for key, val in repo_info[repo_info.index.intersection(keys)].rename(keys).items()]
     if log.level <= logging.INFO:
@@ -626,10 +1062,13 @@ def info(repo_id: Typer.repo_id) -> pandas.Series:
 @app.command('ls')
 def ls():
     '''Print info for all installed utilities.'''
-    repo = [Meta().readKeys(file_path=file_path) for file_path in cfg.metadata_dir.glob('*json')]
+    import pandas
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as pool: # [ThreadPoolExecutor](https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor)
+        repo = list(pool.map(Meta().readKeys, cfg.metadata_dir.glob('*json')))
+    repo = [keys for keys in repo if keys] # a corrupt metadata file yields an empty dict; keep it out of the table instead of producing an all-NaN row
     if not repo:
         return
-    repo = pandas.concat(repo, axis=1).T
+    repo = pandas.DataFrame(repo)
     repo['url'] = repo.url.str.split('/').str[2]
     repo['tag'] = repo.tag.apply(parseVersion)
     repo['language'] = repo.language.apply(lambda row: pandas.Series(row).idxmax() if isinstance(row, dict) else row)
@@ -648,37 +1087,53 @@ def install(repo_id: Typer.repo_id,
             bin_pattern: Typer.bin_pattern = '.*',
             symlink_alias: Typer.symlink_alias = None,
             confirm: Typer.confirm = False,
+            no_cache: Typer.no_cache = False,
             force_download: Typer.force_download = False,
             download_only: Typer.download_only = False,
             quiet: Typer.quiet = False,
             verbose:Typer.verbose = False):
     '''Identify, download, extract asset corresponding to system/OS and symlink executable file(s).'''
-    kwargs = {k: v for k, v in locals().items() if k not in ('confirm', 'force_download', 'download_only', 'quiet', 'verbose')}
+    kwargs = {k: v for k, v in locals().items() if k not in ('confirm', 'no_cache', 'force_download', 'download_only', 'quiet', 'verbose')} # NB: must run before any locals are introduced
+    if no_cache:
+        http_cache.enabled = disk_cache.enabled = False
     log.setLevel(logging.ERROR if quiet else logging.DEBUG if verbose else cfg.log_level)
-    repo, repo_info = repoInfo(repo_id=repo_id)
+    repo = Repo(id=repo_id) # repo info is only needed for the metadata file, not for resolving the release tag; defer querying it until the metadata is written
     tag = tag if not url else parseVersion(url)
     tag_info = tagInfo(repo=repo, tag=tag)
     asset_urls = assetURL(tag_info=tag_info, tag=tag)
     if not url:
         if tag_info.empty:
             return log.error(f"'{tag}' tag not found")
-        if asset_urls.empty:
+        if not asset_urls:
             return log.error(f"no assets corresponding to '{tag}' tag found")
         url = Asset.identify(asset_urls=asset_urls, asset_pattern=asset_pattern)
     if not url:
         return log.error('no release assets found or provided! :(')
-    tag_date = pandas.Timestamp(tag_info.get('published_at', tag_info.get('released_at')))
+    tag_date = parseTimestamp(pick(tag_info, keys=('published_at', 'released_at')))
     if (not confirm) and (not rich.prompt.Confirm.ask(f"proceed with installation of [green]'{tag}'[/] tag ([green]{tag_date}[/])?")):
         return
     asset_url, asset_filename = url, url.split('/')[-1]
     file_path = cfg.cache_dir/asset_filename
-    Asset(file_path=file_path).download(url=asset_url, force=force_download or download_only)
-    Checksum(asset_urls=asset_urls, asset_filename=asset_filename).verify(file_path=file_path)
+    checksum = Checksum(asset_urls=asset_urls, asset_filename=asset_filename)
+    verified = False
+    if file_path.exists() and not (force_download or download_only):
+        try:
+            verified = bool(checksum.verify(file_path=file_path)) # a cached asset matching the published checksum makes the download a no-op
+            if verified:
+                log.info(f'{file_path} already downloaded (checksum verified)')
+        except ValueError:
+            log.warning(f"cached '{file_path}' does not match the published checksum; downloading again")
+            force_download = True
+    if not verified:
+        download_checksum = Asset(file_path=file_path).download(url=asset_url, force=force_download or download_only)
+        checksum.verify(file_path=file_path, download_checksum=download_checksum) # the digest is None when the download was skipped, in which case verify re-hashes the cached file
     if download_only:
         return
     download_meta = dict(repo_id=repo.id, tag=str(tag), asset_pattern=asset_pattern, asset_url=asset_url, asset=str(file_path))
     install_meta = extractAndSymlink(repo=repo, file_path=file_path, bin_pattern=bin_pattern, symlink_alias=symlink_alias)
-    metadata = dict(repo=repo_info.to_dict(), tag=tag_info.to_dict() if not tag_info.empty else {'tag_name': url}, meta={**kwargs, **download_meta, **install_meta})
+    stored_repo_info = Meta().read(repo_id=repo.id).get('repo', {})
+    repo_info = stored_repo_info if stored_repo_info else repoInfo(repo=repo).to_dict() # the stored copy is already a plain dict; reuse it without a Series round-trip (and without re-querying) on upgrades/re-installs
+    metadata = dict(repo=repo_info, tag=tag_info.to_dict() if not tag_info.empty else {'tag_name': url}, meta={**kwargs, **download_meta, **install_meta})
     Meta().write(metadata=metadata)
     if log.level <= logging.INFO:
         RICH_CONSOLE.rule(title=f"installed '{repo.id}'")
@@ -690,15 +1145,38 @@ def upgrade(repo_id: Typer.repo_id, confirm: Typer.confirm = False, quiet: Typer
     '''Upgrade utility to `latest` release.'''
     log.setLevel(logging.ERROR if quiet else logging.DEBUG if verbose else cfg.log_level)
     repo = Repo(id=repo_id)
-    metadata = Meta().read(repo_id=repo.id)
-    tag_info = metadata.get('tag', {})
-    installed_tag = tag_info.get('tag_name')
-    installed_tag_date = pandas.Timestamp(tag_info.get('published_at', tag_info.get('released_at', '1970-01-01T00:00:00Z')))
     latest_tag = tagInfo(repo=repo, tag='latest')
     if latest_tag.empty:
         return
-    latest_tag_date = pandas.Timestamp(latest_tag.get('published_at', latest_tag.get('released_at')))
-    if installed_tag_date >= latest_tag_date:
+    performUpgrade(repo=repo, latest_tag=latest_tag, confirm=confirm, quiet=quiet, verbose=verbose)
+
+
+def checkLatestTag(repo: Repo) -> pandas.Series:
+    '''Fetch the latest release tag for `repo`, isolating failures so one broken repo cannot abort a whole upgrade-all batch.'''
+    import pandas
+    try:
+        return tagInfo(repo=repo, tag='latest')
+    except Exception as error:
+        log.error(f'{repo.id}: {error}')
+        return pandas.Series()
+
+
+def needsUpgrade(repo: Repo, latest_tag: pandas.Series) -> bool:
+    '''Check whether `latest_tag` is newer than the installed tag for `repo` (no side effects).'''
+    tag_info = Meta().read(repo_id=repo.id).get('tag', {})
+    installed_tag_date = parseTimestamp(pick(tag_info, keys=('published_at', 'released_at'), default='1970-01-01T00:00:00Z'))
+    latest_tag_date = parseTimestamp(pick(latest_tag, keys=('published_at', 'released_at')))
+    return bool(latest_tag_date) and (installed_tag_date < latest_tag_date)
+
+
+def performUpgrade(repo: Repo, latest_tag: pandas.Series, confirm: bool = False, quiet: bool = False, verbose: bool = False):
+    '''Upgrade `repo` to `latest_tag` unless the installed tag is already up to date.'''
+    metadata = Meta().read(repo_id=repo.id)
+    tag_info = metadata.get('tag', {})
+    installed_tag = tag_info.get('tag_name')
+    installed_tag_date = parseTimestamp(pick(tag_info, keys=('published_at', 'released_at'), default='1970-01-01T00:00:00Z'))
+    latest_tag_date = parseTimestamp(pick(latest_tag, keys=('published_at', 'released_at')))
+    if (not latest_tag_date) or (installed_tag_date >= latest_tag_date):
         log.info(f"'{repo.id}' installed tag '{installed_tag}' ({installed_tag_date}) is up to date")
         return
     kwarg_tag = metadata.get('meta', {}).get('tag')
@@ -717,10 +1195,21 @@ def upgrade(repo_id: Typer.repo_id, confirm: Typer.confirm = False, quiet: Typer
 def upgradeAll(confirm: Typer.confirm = False, quiet: Typer.quiet = False, verbose: Typer.verbose = False):
     '''Upgrade all installed utilities (except ones installed from url or from a release tag other than `latest`)'''
     log.setLevel(logging.ERROR if quiet else logging.DEBUG if verbose else cfg.log_level)
-    with fileinput.input(files=cfg.metadata_dir.glob('*json'), mode='r') as meta_files:
-        metadata = [json.loads(f).get('meta') for f in meta_files]
-    # _ = [upgrade(repo_id=repo.get('repo_id'), confirm=confirm) for repo in metadata if (repo.get('tag') == 'latest') and (not repo.get('url'))]
-    _ = [upgrade(repo_id=repo.get('repo_id'), confirm=confirm) for repo in metadata if not repo.get('url')]
+    metadata = Meta().installed()
+    repos = [Repo(id=repo.get('repo_id')) for repo in metadata if not repo.get('url')]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as pool: # fan out the release-tag checks (network-bound); the mutating upgrade phase below stays sequential
+        latest_tags = list(pool.map(checkLatestTag, repos))
+    checked = [(repo, latest_tag, needsUpgrade(repo=repo, latest_tag=latest_tag)) for repo, latest_tag in zip(repos, latest_tags) if not latest_tag.empty]
+    up_to_date = [repo.id for repo, latest_tag, needs in checked if not needs]
+    if up_to_date:
+        log.info(f'up to date: {up_to_date}')
+    pending = [(repo, latest_tag) for repo, latest_tag, needs in checked if needs]
+    if not pending:
+        return
+    if (not confirm) and (not rich.prompt.Confirm.ask(f"proceed with upgrade of {[repo.id for repo, _ in pending]}?")): # a single upfront prompt covers the whole batch; per-repo prompts are suppressed below
+        return
+    for repo, latest_tag in pending:
+        performUpgrade(repo=repo, latest_tag=latest_tag, confirm=True, quiet=quiet, verbose=verbose)
 
 
 @app.command('uninstall')
@@ -740,63 +1229,95 @@ def uninstall(repo_id: Typer.repo_id, confirm: Typer.confirm = False, quiet: Typ
     _ = [rmRecursive(path=pathlib.Path(path)) for path in metadata.get('symlinks')]
     rmRecursive(path=pathlib.Path(metadata.get('asset')))
     rmRecursive(path=pathlib.Path(metadata.get('extracted_path')))
-    meta_filepath.unlink(missing_ok=True)
+    Meta().delete(repo_id=repo.id)
     if log.level <= logging.INFO:
         RICH_CONSOLE.rule(title=f"uninstalled '{repo.id}'")
 
 
+def pick(mapping: typing.Dict[str, typing.Any], keys: typing.Sequence[str], default: typing.Any = None) -> typing.Any:
+    '''Return the value for the first of `keys` present in `mapping`.'''
+    return next((mapping[key] for key in keys if key in mapping), default)
+
+def parseTimestamp(timestamp: str) -> datetime.datetime:
+    '''Parse an ISO-8601 timestamp (tolerating a trailing 'Z') into an aware datetime; far cheaper than a pandas.Timestamp for a single value.'''
+    return datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00')) if timestamp else None
+
+@functools.lru_cache(maxsize=64) # repeated installs (e.g. installAll/upgrade-all) reuse the same handful of patterns
+def compileRegex(pattern: str, flags: int = 0) -> re.Pattern:
+    '''Compile (and cache) `pattern`.'''
+    return re.compile(pattern=pattern, flags=flags)
+
+@functools.cache # compiled once per process, without importing `packaging` at module import time
+def versionRegex() -> re.Pattern:
+    '''Return the compiled `packaging.version.VERSION_PATTERN` regex.''' # https://packaging.pypa.io/en/stable/version.html#packaging.version.VERSION_PATTERN
+    import packaging.version
+    return re.compile(pattern=packaging.version.VERSION_PATTERN, flags=(re.VERBOSE|re.IGNORECASE))
+
+@functools.lru_cache(maxsize=1024) # identical version strings recur across asset filenames and 'ls' rows
 def parseVersion(version: str) -> packaging.version.Version:
     '''Parse version based on `packaging.version.VERSION_PATTERN`.'''
-    pattern = re.compile(pattern=packaging.version.VERSION_PATTERN, flags=(re.VERBOSE|re.IGNORECASE)) # https://packaging.pypa.io/en/stable/version.html#packaging.version.VERSION_PATTERN
-    parsed_version = re.search(pattern=pattern, string=version)
+    import packaging.version
+    parsed_version = versionRegex().search(string=version)
     return packaging.version.parse(parsed_version.group(0)) if parsed_version else version
 
 def table(data: pandas.DataFrame, title: str = 'Installed Releases') -> rich.table.Table:
     '''Print `data`: pandas.DataFrame as a `rich.table`.''' # [Convert a pandas.DataFrame object into a rich.Table object for stylized printing in Python.](https://gist.github.com/avi-perl/83e77d069d97edbdde188a4f41a015c4)
-    ansi_color_names = pandas.Series(rich.color.ANSI_COLOR_NAMES).drop_duplicates().sort_values()
-    row_styles = ansi_color_names[ansi_color_names>=160].index.to_list()
-    table = rich.table.Table(title=title, border_style='blue', header_style='orange1', show_edge=False, row_styles=row_styles)
+    table = rich.table.Table(title=title, border_style='blue', header_style='orange1', show_edge=False, row_styles=ROW_STYLES)
     [table.add_column(str(col), max_width=60, no_wrap=True) for col in data.columns]
-    [table.add_row(*[str(x) for x in val]) for val in data.values]
+    [table.add_row(*row) for row in data.astype(str).itertuples(index=False, name=None)] # stringify columnwise once
     return table
 
-def repoInfo(repo_id: str) -> typing.Tuple[Repo, pandas.Series]:
-    repo_info = info(repo_id=repo_id)
-    if repo_info.empty:
-        return Repo('/'), pandas.Series()
-    repo_url = repo_info.get('html_url', repo_info.get('web_url'))
-    return Repo(id=repo_url), repo_info
+def hintAssumedHost(repo: Repo, error: urllib.error.HTTPError):
+    '''Point at the likely cause when a bare `owner/repo` id (assumed to live on github) turns up a 404.'''
+    if (error.code == 404) and repo.host_assumed:
+        log.warning(f"'{repo.id}' was assumed to be a github repo; if it is hosted elsewhere, pass the full url, e.g. 'https://gitlab.com/{repo.id}'")
+
+def repoInfo(repo: Repo) -> pandas.Series:
+    import pandas
+    try:
+        repo_info = repo.info()
+    except urllib.error.HTTPError as e:
+        log.warning(f'{e.code} {e.reason} {e.url}')
+        hintAssumedHost(repo=repo, error=e)
+        repo_info = None
+    return repo_info if repo_info is not None else pandas.Series()
 
 def tagInfo(repo: Repo, tag: str) -> pandas.Series:
+    import pandas
     try:
         return repo.releaseTag(tag=tag)
     except urllib.error.HTTPError as e:
         log.warning(f'{e.code} {e.reason} {e.url}')
+        hintAssumedHost(repo=repo, error=e)
         return pandas.Series()
 
-def assetURL(tag_info: pandas.Series, tag: str) -> pandas.Series:
-    if tag_info.empty or not tag_info.assets:
-        return pandas.Series()
-    assets = pandas.DataFrame(tag_info.assets.get('links') if 'links' in tag_info.assets else tag_info.assets)
-    urls = assets.get('browser_download_url', assets.get('direct_asset_url', pandas.Series()))
-    if urls.empty:
-        return pandas.Series()
-    return urls
+def assetURL(tag_info: pandas.Series, tag: str) -> typing.List[str]:
+    if tag_info.empty or not tag_info.get('assets'):
+        return []
+    assets = tag_info.assets.get('links') if 'links' in tag_info.assets else tag_info.assets # gitlab nests the asset list under 'links'
+    return [url for url in (pick(asset, keys=('browser_download_url', 'direct_asset_url')) for asset in assets) if url]
 
 def extractAndSymlink(repo: Repo, file_path: pathlib.Path, bin_pattern: str, symlink_alias: str) -> typing.Dict[str, typing.Union[str, typing.List[str]]]:
     extracted_path = Asset(file_path=file_path).extract(destination=cfg.data_dir)
+    if hasattr(os, 'posix_fadvise') and file_path.exists(): # linux: the archive has now been streamed for hashing and extraction and will not be read again; release its page-cache footprint (non-archive assets are renamed away by `extract`)
+        fd = os.open(file_path, os.O_RDONLY)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        os.close(fd)
     extracted_bin = Executables.identify(extracted_path=extracted_path, bin_pattern=bin_pattern)
     symlinks = Executables(extracted_bin=extracted_bin, repo_id=repo.id).symlink(symlink_alias=symlink_alias)
-    now = pandas.Timestamp.now('UTC').strftime('%Y-%m-%dT%H:%M:%SZ')
+    now = datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
     return dict(extracted_path=str(extracted_path), extracted_bin=[str(bin) for bin in extracted_bin], symlinks=[str(link) for link in symlinks], installed=now)
 
 def rmRecursive(path: pathlib.Path):
-    '''Remove `path` recursively.''' # [PathLib recursively remove directory?](https://stackoverflow.com/a/66552066)
-    if path.is_symlink() or path.is_file():
+    '''Remove `path` recursively.'''
+    try:
+        path_stat = os.lstat(path) # lstat: a symlink must be unlinked, not followed
+    except FileNotFoundError:
+        return
+    if stat.S_ISDIR(path_stat.st_mode):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
         path.unlink(missing_ok=True)
-    if path.is_dir():
-        _ = [rmRecursive(child) for child in path.iterdir()]
-        path.rmdir()
     log.debug(f'removed {path}')
 
 def installAll():
@@ -849,12 +1370,18 @@ def installAll():
         'exiftool/exiftool': dict(url='https://exiftool.org/Image-ExifTool-12.77.tar.gz'),
         'golang/go': dict(url='https://go.dev/dl/go1.22.0.linux-amd64.tar.gz'),
         'rofl0r/ncdu': dict(url='https://dev.yorhel.nl/download/ncdu-2.3-linux-x86_64.tar.gz')}
-    for repo_id, kwargs in {**go, **rust, **other, **from_url}.items():
-        install(repo_id, **kwargs)
-
-ARCH_PATTERN = SYS().arch_pattern
-OS_PATTERN = SYS().os_pattern
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool: # bounded fan-out: downloads are network-bound and extracts are independent per repo
+        futures = [pool.submit(install, repo_id, confirm=True, **kwargs) for repo_id, kwargs in {**go, **rust, **other, **from_url}.items()]
+        _ = [future.result() for future in concurrent.futures.as_completed(futures)]
+
+SYSTEM = SYS()
+ARCH_PATTERN = SYSTEM.arch_pattern
+OS_PATTERN = SYSTEM.os_pattern
+ARCH_REGEX = re.compile(ARCH_PATTERN, flags=re.IGNORECASE)
+OS_REGEX = re.compile(OS_PATTERN, flags=re.IGNORECASE)
+SYSTEM_REGEX = re.compile(f'{OS_PATTERN}|{ARCH_PATTERN}', flags=re.IGNORECASE) # does a filename embed os/arch info (e.g. 'fzf-linux_amd64')?
 RICH_CONSOLE = rich.console.Console()
+ROW_STYLES = [name for value, name in sorted({value: name for name, value in reversed(list(rich.color.ANSI_COLOR_NAMES.items()))}.items()) if value >= 160] # high-index ansi colors, deduplicated by color number (first name wins), computed once at import
 
 if __name__ == '__main__':
     app()